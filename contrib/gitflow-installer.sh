@@ -54,7 +54,7 @@ case "$1" in
 			echo "Using existing repo: $REPO_NAME"
 		else
 			echo "Cloning repo from GitHub to $REPO_NAME"
-			git clone "$REPO_HOME" "$REPO_NAME"
+			git clone --depth 1 "$REPO_HOME" "$REPO_NAME"
 		fi
 		if [ -f "$REPO_NAME/$SUBMODULE_FILE" ] ; then
 			echo "Submodules look up to date"
@@ -62,8 +62,7 @@ case "$1" in
 			echo "Updating submodules"
 			lastcwd=$PWD
 			cd "$REPO_NAME"
-			git submodule init
-			git submodule update
+			git submodule update --init
 			cd "$lastcwd"
 		fi
 		install -v -d -m 0755 "$INSTALL_PREFIX"